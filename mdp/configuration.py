@@ -2,14 +2,6 @@
 import io as StringIO
 from .repo_revision import get_git_revision
 import mdp
-# python 2/3 compatibility
-try:
-    # Migrate to signature as recommended in
-    # https://docs.python.org/3/library/inspect.html#inspect.getfullargspec
-    from inspect import signature
-    getargs = lambda func: (signature(func)._parameters, None)
-except ImportError:
-    from inspect import getargspec as getargs
 import tempfile
 import os
 import sys
@@ -33,6 +25,12 @@ def __str__(self):
     def __repr__(self):
         return self.info()
 
+    def __delattr__(self, name):
+        super(MetaConfig, self).__delattr__(name)
+        if name.startswith('has_'):
+            # dependency removed, force info() to rebuild its listing
+            self._info_cache_version = -1
+
 
 class config(with_metaclass(MetaConfig, object)):
     """Provide information about optional dependencies.
@@ -86,11 +84,15 @@ class methods `ExternalDepFound` and `ExternalDepFailed`.
     """
 
     _HAS_NUMBER = 0
+    # formatted output of info(), valid as long as _HAS_NUMBER
+    # equals _info_cache_version
+    _info_cache = None
+    _info_cache_version = -1
 
     class _ExternalDep(object):
         def __init__(self, name, version=None, failmsg=None):
-            assert (version is not None) + (failmsg is not None) == 1
-
+            # only created through ExternalDepFound / ExternalDepFailed,
+            # which always pass exactly one of version and failmsg
             self.version = str(version)  # convert e.g. exception to str
             self.failmsg = str(failmsg) if failmsg is not None else None
 
@@ -162,13 +164,21 @@ def info(cls):
 
         This function is used to provide the pytest report header and
         footer.
+
+        The output is cached and only rebuilt when a dependency has
+        been added or removed since the last call.
         """
-        listable_features = [(f[4:].replace('_', ' '), getattr(cls, f))
-                             for f in dir(cls) if f.startswith('has_')]
-        maxlen = max(len(f[0]) for f in listable_features)
-        listable_features = sorted(listable_features, key=lambda f: f[1].order)
-        return '\n'.join('%*s: %r' % (maxlen+1, f[0], f[1])
-                         for f in listable_features)
+        if cls._info_cache_version == cls._HAS_NUMBER:
+            return cls._info_cache
+        listable_features = [(dep.order, f[4:].replace('_', ' '), dep)
+                             for f, dep in list(vars(cls).items())
+                             if f.startswith('has_')]
+        listable_features.sort()
+        width = max(len(f[1]) for f in listable_features) + 1
+        cls._info_cache = '\n'.join('%*s: %r' % (width, name, dep)
+                                    for _, name, dep in listable_features)
+        cls._info_cache_version = cls._HAS_NUMBER
+        return cls._info_cache
 
 
 # In scipy >= 1.4.0 several deprecated members cause issues, see
@@ -338,16 +348,9 @@ def get_numx():
 def get_symeig(numx_linalg):
     # if we have scipy, check if the version of
     # scipy.linalg.eigh supports the rich interface
-    args = getargs(numx_linalg.eigh)[0]
-    if len(args) > 4:
-        # if yes, just wrap it
-        from .utils._symeig import wrap_eigh as symeig
-        config.ExternalDepFound('symeig', 'scipy.linalg.eigh')
-    else:
-        # either we have numpy, or we have an old scipy
-        # we need to use our own rich wrapper
-        from .utils._symeig import _symeig_fake as symeig
-        config.ExternalDepFound('symeig', 'symeig_fake')
+    from .utils._symeig import pick_symeig
+    symeig, description = pick_symeig(numx_linalg)
+    config.ExternalDepFound('symeig', description)
     return symeig
 
 
@@ -441,22 +444,24 @@ def set_configuration():
     config.ExternalDepFound('mdp', version)
 
     # parallel python dependency
-    try:
-        import pp
-        # set pp secret if not there already
-        # (workaround for debian patch to pp that disables pp's default password)
-        pp_secret = os.getenv('MDP_PP_SECRET') or 'mdp-pp-support-password'
-        # module 'user' has been deprecated since python 2.6 and deleted
-        # completely as of python 3.0.
-        # Basically pp can not work on python 3 at the moment.
-        import user
-        if not hasattr(user, 'pp_secret'):
-            user.pp_secret = pp_secret
-    except ImportError as exc:
-        config.ExternalDepFailed('parallel_python', exc)
+    # optional dependencies disabled through the environment are not
+    # imported at all, so they cost nothing at import time
+    if os.getenv('MDP_DISABLE_PARALLEL_PYTHON'):
+        config.ExternalDepFailed('parallel_python', 'disabled')
     else:
-        if os.getenv('MDP_DISABLE_PARALLEL_PYTHON'):
-            config.ExternalDepFailed('parallel_python', 'disabled')
+        try:
+            import pp
+            # set pp secret if not there already
+            # (workaround for debian patch to pp that disables pp's default password)
+            pp_secret = os.getenv('MDP_PP_SECRET') or 'mdp-pp-support-password'
+            # module 'user' has been deprecated since python 2.6 and deleted
+            # completely as of python 3.0.
+            # Basically pp can not work on python 3 at the moment.
+            import user
+            if not hasattr(user, 'pp_secret'):
+                user.pp_secret = pp_secret
+        except ImportError as exc:
+            config.ExternalDepFailed('parallel_python', exc)
         else:
             # even if we can import pp, starting the server may still fail
             # for example with:
@@ -481,16 +486,15 @@ def set_configuration():
                     config.ExternalDepFound('parallel_python', pp.version)
 
     # shogun
-    try:
-        import shogun
-        from shogun import (Kernel as sgKernel,
-                            Features as sgFeatures,
-                            Classifier as sgClassifier)
-    except ImportError as exc:
-        config.ExternalDepFailed('shogun', exc)
+    if os.getenv('MDP_DISABLE_SHOGUN'):
+        config.ExternalDepFailed('shogun', 'disabled')
     else:
-        if os.getenv('MDP_DISABLE_SHOGUN'):
-            config.ExternalDepFailed('shogun', 'disabled')
+        try:
+            from shogun import (Kernel as sgKernel,
+                                Features as sgFeatures,
+                                Classifier as sgClassifier)
+        except ImportError as exc:
+            config.ExternalDepFailed('shogun', exc)
         else:
             # From now on just support shogun < 2.0
             # Between 0.10 to 1.0 or beyond there are too many API changes...
@@ -531,36 +535,38 @@ def set_configuration():
                 config.ExternalDepFailed('libsvm', libsvm_error)
 
     # joblib
-    try:
-        import joblib
-    except ImportError as exc:
-        config.ExternalDepFailed('joblib', exc)
+    if os.getenv('MDP_DISABLE_JOBLIB'):
+        config.ExternalDepFailed('joblib', 'disabled')
     else:
-        version = joblib.__version__
-        if os.getenv('MDP_DISABLE_JOBLIB'):
-            config.ExternalDepFailed('joblib', 'disabled')
-        elif _version_too_old(version, (0, 4, 3)):
-            config.ExternalDepFailed('joblib',
-                                     'version %s is too old' % version)
+        try:
+            import joblib
+        except ImportError as exc:
+            config.ExternalDepFailed('joblib', exc)
         else:
-            config.ExternalDepFound('joblib', version)
+            version = joblib.__version__
+            if _version_too_old(version, (0, 4, 3)):
+                config.ExternalDepFailed('joblib',
+                                         'version %s is too old' % version)
+            else:
+                config.ExternalDepFound('joblib', version)
 
     # sklearn
-    try:
-        try:
-            import sklearn
-        except ImportError:
-            import scikits.learn as sklearn
-        version = sklearn.__version__
-    except ImportError as exc:
-        config.ExternalDepFailed('sklearn', exc)
-    except AttributeError as exc:
-        config.ExternalDepFailed('sklearn', exc)
+    if os.getenv('MDP_DISABLE_SKLEARN'):
+        config.ExternalDepFailed('sklearn', 'disabled')
     else:
-        if os.getenv('MDP_DISABLE_SKLEARN'):
-            config.ExternalDepFailed('sklearn', 'disabled')
-        elif _version_too_old(version, (0, 6)):
-            config.ExternalDepFailed('sklearn',
-                                     'version %s is too old' % version)
+        try:
+            try:
+                import sklearn
+            except ImportError:
+                import scikits.learn as sklearn
+            version = sklearn.__version__
+        except ImportError as exc:
+            config.ExternalDepFailed('sklearn', exc)
+        except AttributeError as exc:
+            config.ExternalDepFailed('sklearn', exc)
         else:
-            config.ExternalDepFound('sklearn', version)
+            if _version_too_old(version, (0, 6)):
+                config.ExternalDepFailed('sklearn',
+                                         'version %s is too old' % version)
+            else:
+                config.ExternalDepFound('sklearn', version)
@@ -10,6 +10,9 @@ def pca(x, **kwargs):
     keyword arguments are specified, they are passed to its constructor.
 
     This is equivalent to ``mdp.nodes.PCANode(**kwargs)(x)``
+
+    If only the principal directions and their variances are needed,
+    ``mdp.utils.eigh_cov(x)`` returns them without training a node.
     """
     return mdp.nodes.PCANode(**kwargs)(x)
 
@@ -41,6 +41,38 @@ def expanded_dim(degree, nvariables):
     """
     return int(mdp.utils.comb(nvariables+degree, degree))-1
 
+# cache for _monomial_offsets, keyed by (degree, nvariables)
+_monomial_offsets_cache = {}
+
+def _monomial_offsets(degree, nvariables):
+    """Return the row offsets used by the polynomial expansion.
+
+    For each degree ``i`` from 2 to ``degree`` a tuple ``(starts, end)`` is
+    returned. The monomials of degree ``i`` are built variable by variable:
+    variable ``j`` multiplies the rows ``starts[j]:end`` of the expansion,
+    which hold the monomials of degree ``i-1`` whose variables all have an
+    index of at least ``j``. The result only depends on the arguments, so it
+    is computed once and cached.
+    """
+    key = (degree, nvariables)
+    if key in _monomial_offsets_cache:
+        return _monomial_offsets_cache[key]
+    offsets = []
+    prec_end = 0
+    next_lens = numx.ones((nvariables+1, ), dtype=numx.int64)
+    next_lens[0] = 0
+    for i in range(2, degree+1):
+        prec_start = prec_end
+        prec_end += nmonomials(i-1, nvariables)
+        lens = next_lens[:-1].cumsum(axis=0)
+        next_lens = numx.zeros((nvariables+1, ), dtype=numx.int64)
+        starts = tuple(int(prec_start+lens[j]) for j in range(nvariables))
+        for j in range(nvariables):
+            next_lens[j+1] = prec_end - starts[j]
+        offsets.append((starts, prec_end))
+    _monomial_offsets_cache[key] = offsets
+    return offsets
+
 class _ExpansionNode(mdp.Node):
 
     def __init__(self, input_dim = None, dtype = None):
@@ -114,32 +146,21 @@ def expanded_dim(self, dim):
         return expanded_dim(self._degree, dim)
 
     def _execute(self, x):
-        degree = self._degree
-        dim = self.input_dim
         n = x.shape[1]
 
-        # preallocate memory
-        dexp = numx.zeros((self.output_dim, x.shape[0]), dtype=self.dtype)
+        # preallocate memory, every row is filled below
+        dexp = numx.empty((self.output_dim, x.shape[0]), dtype=self.dtype)
         # copy monomials of degree 1
         dexp[0:n, :] = x.T
 
+        # multiply contiguous blocks of the previous degree in place
         k = n
-        prec_end = 0
-        next_lens = numx.ones((dim+1, ), dtype=numx.int64)
-        next_lens[0] = 0
-        for i in range(2, degree+1):
-            prec_start = prec_end
-            prec_end += nmonomials(i-1, dim)
-            prec = dexp[prec_start:prec_end, :]
-
-            lens = next_lens[:-1].cumsum(axis=0)
-            next_lens = numx.zeros((dim+1, ), dtype=numx.int64)
-            for j in range(dim):
-                factor = prec[lens[j]:, :]
-                len_ = factor.shape[0]
-                dexp[k:k+len_, :] = x[:, j] * factor
-                next_lens[j+1] = len_
-                k = k+len_
+        for starts, prec_end in _monomial_offsets(self._degree, n):
+            for j in range(n):
+                len_ = prec_end - starts[j]
+                numx.multiply(x[:, j], dexp[starts[j]:prec_end, :],
+                              out=dexp[k:k+len_, :])
+                k += len_
 
         return dexp.T
 
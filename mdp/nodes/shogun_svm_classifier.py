@@ -3,14 +3,22 @@
 from builtins import object
 __docformat__ = "restructuredtext en"
 
+from collections import OrderedDict
+try:
+    from types import MappingProxyType
+except ImportError:
+    # read-only dict views are not available for Python < 3.3
+    MappingProxyType = dict
+
 from shogun import (Kernel as sgKernel,
                     Features as sgFeatures,
                     Classifier as sgClassifier)
 
 import mdp
-from mdp.utils import OrderedDict as _OrderedDict
+from mdp import numx
 
-from .svm_classifiers import _SVMClassifier, _LabelNormalizer
+from .svm_classifiers import (_SVMClassifier, _LabelNormalizer,
+                              _group_by_label)
 
 # switch off spurious warnings from shogun
 import warnings
@@ -18,6 +26,9 @@
                         '.*Perceptron algorithm did not converge after.*',
                         RuntimeWarning)
 
+_sgMachine = sgClassifier.Machine
+_sgRealFeatures = sgFeatures.RealFeatures
+
 # maybe integrate to the class
 def is_shogun_classifier(test_classifier):
     """Check, if a class is a subclass of a SHOGUN classifier.
@@ -30,22 +41,40 @@ def is_shogun_classifier(test_classifier):
         False is returned.
     :rtype: bool
     """
+    # most module attributes are no classes at all, reject them
+    # without going through the exception handling below
+    if not isinstance(test_classifier, type):
+        return False
     try:
-        return issubclass(test_classifier, sgClassifier.Machine)
+        return issubclass(test_classifier, _sgMachine)
     except (TypeError, NameError):
         # need to fetch NameError for some swig reasons
         return False
 
+def _real_features(x):
+    """Wrap the data 'x' (one observation per row) in shogun RealFeatures.
+
+    SHOGUN stores feature matrices column-major with one column per
+    observation, which is exactly the memory layout of a C-contiguous 'x'.
+    Its transpose is therefore a free view which does not have to be
+    reordered when it is handed over to SHOGUN.
+    """
+    return _sgRealFeatures(numx.ascontiguousarray(x).T)
+
+# collect the classifier classes and the classifier type constants
+# in a single pass over the shogun module
 default_shogun_classifiers = []
+# lower case class name -> matching classifiers, used by set_classifier
+_default_shogun_by_name = {}
+shogun_classifier_types = {}
 for labels in dir(sgClassifier):
     test_classifier = getattr(sgClassifier, labels)
-    if is_shogun_classifier(test_classifier):
+    if labels.startswith("CT_"):
+        shogun_classifier_types[test_classifier] = labels
+    elif is_shogun_classifier(test_classifier):
         default_shogun_classifiers.append(test_classifier)
-
-shogun_classifier_types = {}
-for ct in dir(sgClassifier):
-    if ct.startswith("CT_"):
-        shogun_classifier_types[getattr(sgClassifier, ct)] = ct
+        _default_shogun_by_name.setdefault(test_classifier.__name__.lower(),
+                                           []).append(test_classifier)
 
 
 class Classifier(object):
@@ -61,6 +90,14 @@ def __init__(self):
         """
         self._class = None
         self._instance = None
+        # the apply method of _instance, used for labelling
+        self._apply = None
+        # whether _class is a linear or a kernel machine
+        self._is_linear = None
+        self._is_kernel_machine = None
+        # bound set_*/get_* methods of the instance, by parameter name
+        self._set_meth_cache = {}
+        self._get_meth_cache = {}
 
     def set_classifier(self, classifier, args=None):
         """Sets the classifier. If a classifier is reset
@@ -82,6 +119,11 @@ def set_classifier(self, classifier, args=None):
             args = []
         self._class = None
         self._instance = None
+        self._apply = None
+        self._is_linear = None
+        self._is_kernel_machine = None
+        self._set_meth_cache = {}
+        self._get_meth_cache = {}
 
         # If name is a classifier instance: Take it
         if isinstance(classifier, sgClassifier.Machine):
@@ -103,8 +145,8 @@ def set_classifier(self, classifier, args=None):
 
         # If classifier is a string: Check, if it's the name of a default library
         elif isinstance(classifier, basestring):
-            possibleClasses = [labels for labels in default_shogun_classifiers
-                               if labels.__name__.lower() == classifier.lower()]
+            possibleClasses = _default_shogun_by_name.get(classifier.lower(),
+                                                          [])
 
             if not len(possibleClasses):
                 msg = "Library '%s' is not a known subclass of Machine." % classifier
@@ -130,6 +172,11 @@ def set_classifier(self, classifier, args=None):
             msg = "The classifier '%s' is not valid." % classifier
             raise mdp.NodeException(msg)
 
+        self._apply = self._instance.apply
+        self._is_linear = issubclass(self._class, sgClassifier.LinearMachine)
+        self._is_kernel_machine = issubclass(self._class,
+                                             sgClassifier.KernelMachine)
+
 
     def classifier_type(self):
         """Returns the SHOGUN classifier type as a string.
@@ -155,7 +202,11 @@ def set_param(self, param, *value):
             # we call set_C(arg, arg)
             value += value
         # get the parameter setting method
-        meth = getattr(self._instance, "set_" + param)
+        try:
+            meth = self._set_meth_cache[param]
+        except KeyError:
+            meth = getattr(self._instance, "set_" + param)
+            self._set_meth_cache[param] = meth
         # call it
         meth(*value)
 
@@ -171,13 +222,17 @@ def get_param(self, param, *args):
         
         :return: The specified parameter value.
         """
-        meth = getattr(self._instance, "get_" + param)
+        try:
+            meth = self._get_meth_cache[param]
+        except KeyError:
+            meth = getattr(self._instance, "get_" + param)
+            self._get_meth_cache[param] = meth
         return meth(*args)
 
     def set_train_features(self, features, labels):
-        if issubclass(self._class, sgClassifier.LinearMachine):
+        if self._is_linear:
             self._instance.set_features(features)
-        elif issubclass(self._class, sgClassifier.KernelMachine):
+        elif self._is_kernel_machine:
             try:
                 self.kernel.init(features, features)
             except AttributeError:
@@ -195,7 +250,7 @@ def train(self):
 
     def label(self, test_features):
         #return self._instance.classify(test_features).get_labels()
-        return self._instance.apply(test_features).get_labels()
+        return self._apply(test_features).get_labels()
 
     @property
     def takes_kernel(self):
@@ -205,7 +260,7 @@ def takes_kernel(self):
             a kernel machine.
         :rtype: bool
         """
-        return issubclass(self._class, sgClassifier.KernelMachine)
+        return self._is_kernel_machine
 
     def _get_kernel(self):
         """Retrieve the currently set kernel from the classifier instance.
@@ -261,22 +316,22 @@ class ShogunSVMClassifier(_SVMClassifier):
     This node depends on ``shogun``.
     """
 
-    default_parameters = {
+    default_parameters = MappingProxyType({
         'C': 1,
         'epsilon': 1e-3,
-    }
+    })
 
     # Swig-code does not work with named parameters, so we have to define an order
     kernel_parameters = {
         # Simple float64t kernels
-        'Chi2Kernel': [('size', 10), ('width', 1.4)],
-        'GaussianKernel': [('size', 10), ('width', 1.9)],
-        'LinearKernel': [],
-        'PolyKernel': [('size', 10), ('degree', 3), ('inhomogene', True)],
-        'PyramidChi2': [('size',), ('num_cells2',),
+        'Chi2Kernel': (('size', 10), ('width', 1.4)),
+        'GaussianKernel': (('size', 10), ('width', 1.9)),
+        'LinearKernel': (),
+        'PolyKernel': (('size', 10), ('degree', 3), ('inhomogene', True)),
+        'PyramidChi2': (('size',), ('num_cells2',),
                         ('weights_foreach_cell2',), ('width_computation_type2',),
-                        ('width2',)],
-        'SigmoidKernel': [('size', 10), ('gamma', 1), ('coef0', 0)]
+                        ('width2',)),
+        'SigmoidKernel': (('size', 10), ('gamma', 1), ('coef0', 0))
     }
 
     def __init__(self, classifier="libsvmmulticlass", classifier_arguments=(),
@@ -335,13 +390,17 @@ def __init__(self, classifier="libsvmmulticlass", classifier_arguments=(),
 
         self.classifier = Classifier()
         self.classifier.set_classifier(classifier, classifier_arguments)
-        self.classifier_options = self.default_parameters
+        # copy, so that the class defaults are never modified
+        self.classifier_options = dict(self.default_parameters)
         self.classifier_options.update(classifier_options)
 
-        for p in list(self.classifier_options.keys()):
+        set_param = self.set_classifier_param
+        for p, v in self.classifier_options.items():
             try:
-                self.set_classifier_param(p, self.classifier_options[p])
-            except Exception:
+                set_param(p, v)
+            except (AttributeError, TypeError, NotImplementedError):
+                # the classifier does not have this parameter, or SWIG
+                # found no matching overload for the given value
                 pass
 
         self._num_threads = num_threads
@@ -410,20 +469,27 @@ def set_kernel(self, kernel_name, kernel_options=None):
         """
         if kernel_options is None:
             kernel_options = {}
-        if kernel_name in ShogunSVMClassifier.kernel_parameters \
-            and not isinstance(kernel_options, list):
-            default_opts = _OrderedDict(ShogunSVMClassifier.kernel_parameters[kernel_name])
+        if isinstance(kernel_options, list):
+            options = kernel_options
+        elif kernel_name in ShogunSVMClassifier.kernel_parameters:
+            default_opts = OrderedDict(ShogunSVMClassifier.kernel_parameters[kernel_name])
             default_opts.update(kernel_options)
             options = list(default_opts.values())
+        elif not kernel_options:
+            options = []
+        else:
+            msg = ("No default options known for kernel '%s', the options "
+                   "must be given as an ordered list." % kernel_name)
+            raise mdp.NodeException(msg)
 
         kernel_meth = getattr(sgKernel, kernel_name)
         try:
             kernel = kernel_meth(*options)
-        except NotImplementedError as msg:
-            msg = ("Tried to call %s with arguments %s\n" %
-                   (kernel_meth.__module__ + '.' + kernel_meth.__name__,
-                    tuple(options).__repr__()) +
-                   "Got the following error message:\n" + msg.__str__())
+        except NotImplementedError as exc:
+            msg = ("Tried to call %s.%s with arguments %r\n"
+                   "Got the following error message:\n%s" %
+                   (kernel_meth.__module__, kernel_meth.__name__,
+                    tuple(options), exc))
             raise mdp.NodeException(msg)
         self.classifier.kernel = kernel
 
@@ -432,9 +498,9 @@ def _stop_training(self):
         self.normalizer = _LabelNormalizer(self.labels)
         labels = self.normalizer.normalize(self.labels)
         # shogun expects float labels
-        labels = sgFeatures.Labels(labels.astype(float))
+        labels = sgFeatures.Labels(numx.asarray(labels, dtype='float64'))
 
-        features = sgFeatures.RealFeatures(self.data.transpose())
+        features = _real_features(self.data)
 
         self.classifier.set_train_features(features, labels)
         self.classifier.train()
@@ -442,19 +508,18 @@ def _stop_training(self):
     def training_set(self, ordered=False):
         """Shows the set of data that has been inserted to be trained."
         
-        :param ordered: 
+        :param ordered: If True, group the data by label.
         :return: The set of data that has been inserted to be trained.
+            If ordered is True, a dict mapping each label to the list
+            of data points carrying that label.
         """
+        # the arrays can be larger than the data while training
+        data = self.data[:self.tlen]
+        labels = self.labels[:self.tlen]
         if ordered:
-            labels = set(self.labels)
-            data = {}
-            for l in labels:
-                data[l] = []
-            for k, v in zip(self.labels, self.data):
-                data[k].append(v)
-            return data
+            return _group_by_label(data, labels)
         else:
-            return list(zip(self.labels, self.data))
+            return list(zip(labels, data))
 
     def _label(self, x):
         """Classify the input data 'x'
@@ -462,7 +527,7 @@ def _label(self, x):
         :param x: The input data to classify.
         :return: The corresponding labels for the input.
         """
-        test_features = sgFeatures.RealFeatures(x.transpose())
+        test_features = _real_features(x)
 
         labels = self.classifier.label(test_features)
 
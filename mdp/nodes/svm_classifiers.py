@@ -2,18 +2,20 @@
 
 TODO: Implement some scaling. Either by special Scaling Node or internally.
 """
-from builtins import map
 from builtins import zip
 from builtins import object
 
 import mdp
-from mdp import ClassifierCumulator
-from itertools import count
+from mdp import numx, ClassifierCumulator
 
 class _LabelNormalizer(object):
     """This class provides a transparent mapping from arbitrary labels
     to a set of well-defined integers.
 
+    The labels must be sortable, since they are looked up in a sorted
+    array (e.g. numbers or strings, but not a mixture of both in an
+    object array).
+
     TODO: This could actually be a node.
     TODO: Needs more refinement. E.g. could automatically round labels to +1, -1
     """
@@ -29,37 +31,49 @@ def __init__(self, labels, mode=None):
             return
 
         self._mode = mode
-        self._labels = set(labels)
-        self._mapping = {}
-        self._inverse = {}
+        # sorted unique labels and their normalised counterparts, so that
+        # labels can be translated in one go with searchsorted
+        try:
+            self._labels = numx.unique(labels)
+        except TypeError as exception:
+            msg = "The labels must be sortable: %s" % exception
+            raise mdp.NodeException(msg)
         if mode == "dual":
             if len(self._labels) > 2:
                 msg = "In dual mode only two labels can be given"
                 raise mdp.NodeException(msg)
-            t_label_norm = list(zip(self._labels, [1, -1]))
-            self._set_label_dicts(t_label_norm)
+            self._norm_labels = numx.array([1, -1][:len(self._labels)])
         elif mode == "multi":
             # enumerate from zero to len
-            t_label_norm = list(zip(self._labels, count()))
-            self._set_label_dicts(t_label_norm)
+            self._norm_labels = numx.arange(len(self._labels))
         else:
             msg = "Remapping mode not known"
             raise mdp.NodeException(msg)
+        order = self._norm_labels.argsort()
+        self._sorted_norm_labels = self._norm_labels[order]
+        self._inverse_labels = self._labels[order]
 
-    def _set_label_dicts(self, t_label_norm):
-        self._mapping = dict(t_label_norm)
-        self._inverse = dict((norm, label) for label, norm in t_label_norm)
-
-        # check that neither original nor normalised labels have occured more than once
-        if not (len(self._mapping) == len(t_label_norm) == len(self._inverse)):
-            msg = "Error in label normalisation."
+    @staticmethod
+    def _lookup(keys, values, items):
+        """Map each of 'items' to the value of the matching entry
+        in the sorted array 'keys'."""
+        items = numx.asarray(items)
+        try:
+            idx = numx.searchsorted(keys, items).clip(0, len(keys) - 1)
+        except TypeError:
+            msg = "Label not comparable to the labels of the normaliser."
             raise mdp.NodeException(msg)
+        if not numx.all(keys[idx] == items):
+            msg = "Label not known to the normaliser."
+            raise mdp.NodeException(msg)
+        return values[idx]
 
     def normalize(self, labels):
-        return list(map(self._mapping.get, labels))
+        return self._lookup(self._labels, self._norm_labels, labels)
 
     def revert(self, norm_labels):
-        return list(map(self._inverse.get, norm_labels))
+        return self._lookup(self._sorted_norm_labels, self._inverse_labels,
+                            norm_labels)
 
     def _id(self, labels):
         return labels
@@ -91,3 +105,64 @@ def __init__(self, input_dim=None, output_dim=None, dtype=None):
     @staticmethod
     def is_invertible():
         return False
+
+    def _train(self, x, labels):
+        """Cumulate all input data and labels in arrays.
+
+        The arrays are allocated for the first chunk and doubled in size
+        whenever a later chunk does not fit anymore.
+        """
+        # if labels is a number, all x's belong to the same class
+        if not isinstance(labels, (list, tuple, numx.ndarray)):
+            labels = [labels] * x.shape[0]
+        labels = numx.asarray(labels).ravel()
+        start = self.tlen
+        self.tlen += x.shape[0]
+        if isinstance(self.data, list):
+            # first chunk
+            self.data = numx.empty((self.tlen, x.shape[1]), dtype=self.dtype)
+            self.labels = numx.empty(self.tlen, dtype=labels.dtype)
+        else:
+            capacity = len(self.data)
+            if self.tlen > capacity:
+                capacity = max(self.tlen, 2 * capacity)
+            self.data = _reserve(self.data, start, capacity, self.dtype)
+            self.labels = _reserve(self.labels, start, capacity,
+                                   numx.promote_types(self.labels.dtype,
+                                                      labels.dtype))
+        self.data[start:self.tlen] = x
+        self.labels[start:self.tlen] = labels
+
+    def _stop_training(self, *args, **kwargs):
+        """Trim the data and label arrays to the cumulated data points."""
+        if isinstance(self.data, list):
+            # no data has been cumulated
+            super(_SVMClassifier, self)._stop_training(*args, **kwargs)
+            return
+        self.data = _reserve(self.data, self.tlen, self.tlen, self.dtype)
+        self.labels = _reserve(self.labels, self.tlen, self.tlen,
+                               self.labels.dtype)
+
+
+def _reserve(buffer, used, capacity, dtype):
+    """Return 'buffer' if it already has the given capacity and dtype,
+    otherwise a new array of that capacity and dtype holding the first
+    'used' entries of 'buffer'."""
+    if len(buffer) == capacity and buffer.dtype == dtype:
+        return buffer
+    new = numx.empty((capacity,) + buffer.shape[1:], dtype=dtype)
+    new[:used] = buffer[:used]
+    return new
+
+
+def _group_by_label(data, labels):
+    """Return a dict mapping each label to the list of the data points
+    carrying that label, in their original order."""
+    if not len(labels):
+        return {}
+    labels, inverse = numx.unique(labels, return_inverse=True)
+    # a stable sort keeps the original order within each label
+    order = inverse.argsort(kind='mergesort')
+    bounds = numx.bincount(inverse).cumsum()[:-1]
+    groups = numx.split(numx.asarray(data)[order], bounds)
+    return dict((label, list(group)) for label, group in zip(labels, groups))
@@ -126,12 +126,14 @@ def _shutdown(self):
         If a process is still running a task then an exception is raised.
         """
         self._lock.acquire()
-        if len(self._free_processes) < self._n_processes:
-            raise Exception("some slave process is still working")
-        for process in self._free_processes:
-            pickle.dump("EXIT", process.stdin)
-            process.stdin.flush()
-        self._lock.release()
+        try:
+            if len(self._free_processes) < self._n_processes:
+                raise Exception("some slave process is still working")
+            for process in self._free_processes:
+                pickle.dump("EXIT", process.stdin)
+                process.stdin.flush()
+        finally:
+            self._lock.release()
         if self.verbose:
             print("scheduler shutdown")
 
@@ -187,9 +189,10 @@ def _task_thread(self, process, data, task_callable, task_index):
             traceback.print_exc()
             self._free_processes.append(process)
             sys.exit("failed to execute task %d in process:" % task_index)
-        # store the result and clean up
-        self._store_result(result, task_index)
+        # free the process before storing the result, since get_results
+        # returns as soon as the last result is stored
         self._free_processes.append(process)
+        self._store_result(result, task_index)
 
 
 def _process_run(cache_callable=True):
@@ -214,6 +214,8 @@ def __init__(self, result_container=None, verbose=False):
         # count the number of submitted tasks, also used for the task index
         self._task_counter = 0
         self._lock = threading.Lock()
+        # signalled by _store_result when the last open task has finished
+        self._tasks_done = threading.Condition(self._lock)
         self._last_callable = None  # last callable is stored
         # task index of the _last_callable, can be *.5 if updated between tasks
         self._last_callable_index = -1.0
@@ -297,22 +299,25 @@ def _store_result(self, result, task_index):
             else:
                 print("    task failed")
         self._n_open_tasks -= 1
+        if not self._n_open_tasks:
+            self._tasks_done.notify_all()
         self._lock.release()
 
     def get_results(self):
         """Get the accumulated results from the result container.
 
-        This method blocks if there are open tasks.
+        This method blocks if there are open tasks. It returns as soon as the
+        last result has been stored, instead of polling the task counter.
         """
-        while True:
-            self._lock.acquire()
-            if self._n_open_tasks == 0:
-                results = self.result_container.get_results()
-                self._lock.release()
-                return results
-            else:
-                self._lock.release()
-                time.sleep(1)
+        self._lock.acquire()
+        try:
+            while self._n_open_tasks:
+                # _store_result wakes us up immediately, the timeout only
+                # keeps the wait interruptible (e.g. by Ctrl-C on Python 2)
+                self._tasks_done.wait(1.0)
+            return self.result_container.get_results()
+        finally:
+            self._lock.release()
 
     def shutdown(self):
         """Controlled shutdown of the scheduler.
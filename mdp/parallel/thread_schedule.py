@@ -60,6 +60,8 @@ def _process_task(self, data, task_callable, task_index):
                 time.sleep(SLEEP_TIME)
                 self._lock.acquire()
             else:
+                # reserve a thread, it is freed again in _task_thread
+                self._n_active_threads += 1
                 self._lock.release()
                 task_callable = task_callable.fork()
                 if self.copy_callable:
@@ -79,9 +81,15 @@ def _process_task(self, data, task_callable, task_index):
                         print ("unable to create new thread,"
                                " waiting 2 seconds...")
                     time.sleep(2)
+                    self._lock.acquire()
+                    self._n_active_threads -= 1
 
     def _task_thread(self, data, task_callable, task_index):
         """Thread function which processes a single task."""
         result = task_callable(data)
-        self._store_result(result, task_index)
+        # free the thread before storing the result, since get_results
+        # returns as soon as the last result is stored
+        self._lock.acquire()
         self._n_active_threads -= 1
+        self._lock.release()
+        self._store_result(result, task_index)
@@ -18,13 +18,25 @@ def pytest_configure(config):
     seed = config.getvalue("seed")
     # if seed was not set by the user, we set one now
     if seed is None or seed == ('NO', 'DEFAULT'):
-        config.option.seed = int(mdp.numx_rand.randint(2**31-1))
+        workerinput = getattr(config, 'workerinput', {})
+        if 'mdp_seed' in workerinput:
+            # pytest-xdist worker, use the seed of the controlling process
+            config.option.seed = workerinput['mdp_seed']
+        else:
+            config.option.seed = int(mdp.numx_rand.randint(2**31-1))
 
     # get temp dir
     pytest.mdp_tempdirname = tempfile.mkdtemp(
         suffix='.tmp', prefix='MDPtestdir_')
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # pytest-xdist hook, hand the seed to the worker processes so that all
+    # the tests of a distributed run use the reported seed
+    node.workerinput['mdp_seed'] = node.config.option.seed
+
+
 def pytest_unconfigure(config):
     # remove garbage created during tests
     # note that usage of TemporaryDirectory is not enough to assure
@@ -38,3 +38,14 @@ def test_config_depfailed_string(self):
         info = config.info()
         assert 'test property' in info
         assert 'GOOGOO' in info
+
+    def test_config_info_cache(self):
+        config.ExternalDepFound('test_property', '0.777')
+        info = config.info()
+        assert info is config.info()
+        delattr(config, 'has_test_property')
+        assert 'test property' not in config.info()
+        config.ExternalDepFailed('test_property', 'GOOGOO')
+        info = config.info()
+        assert 'test property' in info
+        assert 'GOOGOO' in info
@@ -1,27 +1,59 @@
-from builtins import range
 from ._tools import *
 
 import mdp.parallel as parallel
 n = numx
 
-def test_tasks():
+# The data is generated once per module and shared by the tests. Each
+# fixture draws from its own random state, seeded from the test seed, so the
+# data does not depend on which tests run or in which order. The chunk
+# lists are views into a single block of memory. The arrays are read-only,
+# so a node modifying its input cannot affect other tests.
+# Single precision is used, since the tests only check that training and
+# execution run through and the float32 data halves the memory traffic.
+
+def _shared_random(request, key, shape, scale=1):
+    """Return read-only float32 random data for the fixture 'key'."""
+    rand = numx_rand.RandomState([request.config.option.seed, key])
+    x = (rand.random_sample(shape) * scale).astype('f')
+    x.flags.writeable = False
+    return x
+
+@pytest.fixture(scope="module")
+def train_chunks(request):
+    """Six training chunks with differently scaled input components."""
+    return list(_shared_random(request, 0, (6,30,10),
+                               scale=n.arange(1,11)))
+
+@pytest.fixture(scope="module")
+def exec_block(request):
+    """Execution data as a single block of six (20, 10) chunks."""
+    return _shared_random(request, 1, (6,20,10))
+
+@pytest.fixture(scope="module")
+def exec_chunks(exec_block):
+    """Six chunks for parallel execution."""
+    return list(exec_block)
+
+@pytest.fixture(scope="module")
+def exec_x(exec_block):
+    """The execution chunks as one array, for a single normal execute."""
+    return exec_block.reshape(-1, 10)
+
+def test_tasks(train_chunks, exec_chunks):
     """Test parallel training and execution by running the tasks."""
     flow = parallel.ParallelFlow([
                         mdp.nodes.SFANode(output_dim=5),
                         mdp.nodes.PolynomialExpansionNode(degree=3),
                         mdp.nodes.SFANode(output_dim=20)])
-    data_iterables = [[n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)],
+    data_iterables = [train_chunks,
                       None,
-                      [n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)]]
+                      train_chunks]
     scheduler = parallel.Scheduler()
     flow.train(data_iterables, scheduler=scheduler)
     # parallel execution
-    iterable = [n.random.random((20,10)) for _ in range(6)]
-    flow.execute(iterable, scheduler=scheduler)
+    flow.execute(exec_chunks, scheduler=scheduler)
 
-def test_non_iterator():
+def test_non_iterator(exec_x):
     """Test parallel training and execution with a single array."""
     flow = parallel.ParallelFlow([
                         mdp.nodes.SFANode(output_dim=5),
@@ -31,47 +63,30 @@ def test_non_iterator():
     scheduler = parallel.Scheduler()
     flow.train(data_iterables, scheduler=scheduler)
     # test execution
-    x = n.random.random((100,10))
-    flow.execute(x)
+    flow.execute(exec_x)
 
-def test_multiple_schedulers():
-    """Test parallel flow training with multiple schedulers."""
-    flow = parallel.ParallelFlow([
-                        mdp.nodes.SFANode(output_dim=5),
-                        mdp.nodes.PolynomialExpansionNode(degree=3),
-                        mdp.nodes.SFANode(output_dim=20)])
-    data_iterables = [[n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)],
-                      None,
-                      [n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)]]
-    schedulers = [parallel.Scheduler(), None, parallel.Scheduler()]
-    flow.train(data_iterables, scheduler=schedulers)
-    # parallel execution
-    iterable = [n.random.random((20,10)) for _ in range(6)]
-    flow.execute(iterable, scheduler=parallel.Scheduler())
+@pytest.mark.parametrize("first_untrainable", [False, True])
+def test_multiple_schedulers(train_chunks, exec_chunks, first_untrainable):
+    """Test parallel flow training with multiple schedulers.
 
-def test_multiple_schedulers2():
-    """Test parallel flow training with multiple schedulers (part 2)."""
-    # now the first node is untrainable as well
-    flow = parallel.ParallelFlow([
-                        mdp.nodes.PolynomialExpansionNode(degree=2),
-                        mdp.nodes.SFANode(output_dim=5),
-                        mdp.nodes.PolynomialExpansionNode(degree=3),
-                        mdp.nodes.SFANode(output_dim=20)])
-    data_iterables = [None,
-                      [n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)],
-                      None,
-                      [n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)]]
-    schedulers = [None, parallel.Scheduler(), None, parallel.Scheduler()]
+    With first_untrainable the flow starts with an untrainable node, which
+    has to be skipped together with its scheduler.
+    """
+    nodes = [mdp.nodes.SFANode(output_dim=5),
+             mdp.nodes.PolynomialExpansionNode(degree=3),
+             mdp.nodes.SFANode(output_dim=20)]
+    data_iterables = [train_chunks, None, train_chunks]
+    schedulers = [parallel.Scheduler(), None, parallel.Scheduler()]
+    if first_untrainable:
+        nodes.insert(0, mdp.nodes.PolynomialExpansionNode(degree=2))
+        data_iterables.insert(0, None)
+        schedulers.insert(0, None)
+    flow = parallel.ParallelFlow(nodes)
     flow.train(data_iterables, scheduler=schedulers)
     # parallel execution
-    iterable = [n.random.random((20,10)) for _ in range(6)]
-    flow.execute(iterable, scheduler=parallel.Scheduler())
+    flow.execute(exec_chunks, scheduler=parallel.Scheduler())
 
-def test_multiphase():
+def test_multiphase(train_chunks, exec_chunks, exec_x):
     """Test parallel training and execution for nodes with multiple
     training phases.
     """
@@ -82,19 +97,16 @@ def test_multiphase():
                         flownode,
                         mdp.nodes.PolynomialExpansionNode(degree=2),
                         mdp.nodes.SFANode(output_dim=5)])
-    data_iterables = [[n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)],
+    data_iterables = [train_chunks,
                       None,
-                      [n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)]]
+                      train_chunks]
     scheduler = parallel.Scheduler()
     flow.train(data_iterables, scheduler=scheduler)
     # test normal execution
-    x = n.random.random([100,10])
-    flow.execute(x)
-    # parallel execution
-    iterable = [n.random.random((20,10)) for _ in range(6)]
-    flow.execute(iterable, scheduler=scheduler)
+    y = flow.execute(exec_x)
+    # parallel execution of the same data in chunks
+    y_chunks = flow.execute(exec_chunks, scheduler=scheduler)
+    assert_array_almost_equal(y_chunks, y, 4)
 
 def test_firstnode():
     """Test special case in which the first node is untrainable.
@@ -109,7 +121,7 @@ def test_firstnode():
     scheduler = parallel.Scheduler()
     flow.train(data_iterables, scheduler=scheduler)
 
-def test_multiphase_checkpoints():
+def test_multiphase_checkpoints(train_chunks):
     """Test parallel checkpoint flow."""
     sfa_node = mdp.nodes.SFANode(input_dim=10, output_dim=8)
     sfa2_node = mdp.nodes.SFA2Node(input_dim=8, output_dim=6)
@@ -118,86 +130,58 @@ def test_multiphase_checkpoints():
                         flownode,
                         mdp.nodes.PolynomialExpansionNode(degree=2),
                         mdp.nodes.SFANode(output_dim=5)])
-    data_iterables = [[n.random.random((30,10)) for _ in range(6)],
+    data_iterables = [train_chunks,
                       None,
-                      [n.random.random((30,10)) for _ in range(6)]]
+                      train_chunks]
     checkpoint = mdp.CheckpointFunction()
     scheduler = parallel.Scheduler()
     flow.train(data_iterables, scheduler=scheduler, checkpoints=checkpoint)
 
-def test_nonparallel1():
+@pytest.mark.parametrize("node_factory",
+                         [lambda: mdp.nodes.CuBICANode(input_dim=8),
+                          lambda: mdp.nodes.SFA2Node(input_dim=8,
+                                                     output_dim=6)],
+                         ids=["CuBICANode", "SFA2Node"])
+def test_nonparallel(train_chunks, exec_x, node_factory):
     """Test training for mixture of parallel and non-parallel nodes."""
     sfa_node = mdp.nodes.SFANode(input_dim=10, output_dim=8)
     # TODO: use a node with no parallel here
-    sfa2_node = mdp.nodes.CuBICANode(input_dim=8)
-    flownode = mdp.hinet.FlowNode(mdp.Flow([sfa_node, sfa2_node]))
-    flow = parallel.ParallelFlow([
-                        flownode,
-                        mdp.nodes.PolynomialExpansionNode(degree=2),
-                        mdp.nodes.SFANode(output_dim=5)])
-    data_iterables = [[n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)],
-                      None,
-                      [n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)]]
-    scheduler = parallel.Scheduler()
-    flow.train(data_iterables, scheduler=scheduler)
-    # test execution
-    x = n.random.random([100,10])
-    flow.execute(x)
-
-def test_nonparallel2():
-    """Test training for mixture of parallel and non-parallel nodes."""
-    # TODO: use a node with no parallel here
-    sfa_node = mdp.nodes.SFANode(input_dim=10, output_dim=8)
-    sfa2_node = mdp.nodes.SFA2Node(input_dim=8, output_dim=6)
-    flownode = mdp.hinet.FlowNode(mdp.Flow([sfa_node, sfa2_node]))
+    flownode = mdp.hinet.FlowNode(mdp.Flow([sfa_node, node_factory()]))
     flow = parallel.ParallelFlow([
                         flownode,
                         mdp.nodes.PolynomialExpansionNode(degree=2),
                         mdp.nodes.SFANode(output_dim=5)])
-    data_iterables = [[n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)],
+    data_iterables = [train_chunks,
                       None,
-                      [n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)]]
+                      train_chunks]
     scheduler = parallel.Scheduler()
     flow.train(data_iterables, scheduler=scheduler)
     # test execution
-    x = n.random.random([100,10])
-    flow.execute(x)
+    flow.execute(exec_x)
 
-def test_nonparallel3():
+def test_nonparallel3(train_chunks, exec_x):
     """Test training for non-parallel nodes."""
     # TODO: use a node with no parallel here
     sfa_node = mdp.nodes.SFANode(input_dim=10, output_dim=8)
     # TODO: use a node with no parallel here
     sfa2_node = mdp.nodes.SFA2Node(input_dim=8, output_dim=6)
     flow = parallel.ParallelFlow([sfa_node, sfa2_node])
-    data_iterables = [[n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)],
-                      [n.random.random((30,10))*n.arange(1,11)
-                       for _ in range(6)]]
+    data_iterables = [train_chunks,
+                      train_chunks]
     scheduler = parallel.Scheduler()
     flow.train(data_iterables, scheduler=scheduler)
-    while flow.is_parallel_training:
-        results = []
-        while flow.task_available():
-            task = flow.get_task()
-            results.append(task())
-        flow.use_results(results)
+    assert not flow.is_parallel_training
     # test execution
-    x = n.random.random([100,10])
-    flow.execute(x)
+    flow.execute(exec_x)
     
-def test_train_purge_nodes():
+def test_train_purge_nodes(train_chunks):
     """Test that FlowTrainCallable correctly purges nodes."""
     sfa_node = mdp.nodes.SFANode(input_dim=10, output_dim=8)
     sfa2_node = mdp.nodes.SFA2Node(input_dim=8, output_dim=6)
     flownode = mdp.hinet.FlowNode(mdp.Flow([sfa_node,
                                             mdp.nodes.IdentityNode(),
                                             sfa2_node]))
-    data = n.random.random((30,10))
+    data = train_chunks[0]
     mdp.activate_extension("parallel")
     try:
         clbl = mdp.parallel.FlowTrainCallable(flownode)
@@ -206,7 +190,7 @@ def test_train_purge_nodes():
         mdp.deactivate_extension("parallel")
     assert flownode._flow[1].__class__.__name__ == "_DummyNode"
     
-def test_execute_fork():
+def test_execute_fork(train_chunks, exec_chunks):
     """Test the forking of a node based on use_execute_fork."""
     
     class _test_ExecuteForkNode(mdp.nodes.IdentityNode):
@@ -234,12 +218,12 @@ def use_execute_fork(self):
             return True
     
     try:
-        n_chunks = 6
+        n_chunks = len(train_chunks)
         
         ## Part 1: test execute fork during flow training
-        data_iterables = [[n.random.random((30,10)) for _ in range(n_chunks)],
+        data_iterables = [train_chunks,
                           None,
-                          [n.random.random((30,10)) for _ in range(n_chunks)],
+                          train_chunks,
                           None]
         flow = parallel.ParallelFlow([mdp.nodes.PCANode(output_dim=5),
                                       _test_ExecuteForkNode(),
@@ -256,12 +240,11 @@ def use_execute_fork(self):
                 node.n_joins = 0
                 
         ## Part 2: test execute fork during flow execute
-        data_iterable = [n.random.random((30,10)) for _ in range(n_chunks)]
-        flow.execute(data_iterable, scheduler=scheduler)
+        flow.execute(exec_chunks, scheduler=scheduler)
         for node in flow:
             if isinstance(node, _test_ExecuteForkNode):
-                assert node.n_forks == n_chunks
-                assert node.n_joins == n_chunks
+                assert node.n_forks == len(exec_chunks)
+                assert node.n_joins == len(exec_chunks)
     finally:
         # unregister the testing class
         del mdp.get_extensions()["parallel"][_test_ExecuteForkNode]
@@ -1,9 +1,25 @@
 from builtins import range
 from ._tools import *
 
+import time
+
 import mdp.parallel as parallel
 n = numx
 
+@pytest.fixture(scope="module")
+def uncached_scheduler():
+    """Process scheduler with caching turned off.
+
+    Starting the worker processes dominates the runtime of the short tests,
+    so the tests which use this configuration share a single scheduler.
+    """
+    scheduler = parallel.ProcessScheduler(verbose=False,
+                                          n_processes=2,
+                                          source_paths=None,
+                                          cache_callable=False)
+    yield scheduler
+    scheduler.shutdown()
+
 def test_process_scheduler_shutdown():
     """Test that we can properly shutdown the subprocesses"""
     scheduler = parallel.ProcessScheduler(verbose=False,
@@ -12,6 +28,28 @@ def test_process_scheduler_shutdown():
                                           cache_callable=False)
     scheduler.shutdown()
 
+class _SlowStoreProcessScheduler(parallel.ProcessScheduler):
+    """Process scheduler which pauses after storing a result."""
+
+    def _store_result(self, result, task_index):
+        super(_SlowStoreProcessScheduler, self)._store_result(result,
+                                                              task_index)
+        time.sleep(0.05)
+
+def test_process_scheduler_shutdown_after_results():
+    """Test shutdown right after get_results returned.
+
+    All processes must be free again once the last result is available.
+    """
+    scheduler = _SlowStoreProcessScheduler(verbose=False,
+                                           n_processes=2,
+                                           source_paths=None)
+    for i in range(4):
+        scheduler.add_task(i, parallel.SqrTestCallable())
+    results = scheduler.get_results()
+    scheduler.shutdown()
+    assert n.all(n.array(results) == n.array([0,1,4,9]))
+
 def test_process_scheduler_order():
     """Test the correct result order in process scheduler."""
     scheduler = parallel.ProcessScheduler(verbose=False,
@@ -29,16 +67,12 @@ def test_process_scheduler_order():
                      n.concatenate([n.arange(0,i+1)**2
                                     for i in range(max_i)]))
 
-def test_process_scheduler_no_cache():
+def test_process_scheduler_no_cache(uncached_scheduler):
     """Test process scheduler with caching turned off."""
-    scheduler = parallel.ProcessScheduler(verbose=False,
-                                          n_processes=2,
-                                          source_paths=None,
-                                          cache_callable=False)
+    scheduler = uncached_scheduler
     for i in range(8):
         scheduler.add_task(i, parallel.SqrTestCallable())
     results = scheduler.get_results()
-    scheduler.shutdown()
     # check result
     results = n.array(results)
     assert n.all(results == n.array([0,1,4,9,16,25,36,49]))
@@ -83,16 +117,12 @@ def test_process_scheduler_flow():
     y2 = parallel_flow.execute(x)
     assert_array_almost_equal(abs(y1), abs(y2), precision)
 
-def test_process_scheduler_mdp_version():
+def test_process_scheduler_mdp_version(uncached_scheduler):
     """Test that we are running the same mdp in subprocesses"""
-    scheduler = parallel.ProcessScheduler(verbose=False,
-                                          n_processes=2,
-                                          source_paths=None,
-                                          cache_callable=False)
+    scheduler = uncached_scheduler
     for i in range(2):
         scheduler.add_task(i, parallel.MDPVersionCallable())
     out = scheduler.get_results()
-    scheduler.shutdown()
     # check that we get 2 identical dictionaries
     assert out[0] == out[1], 'Subprocesses did not run '\
         'the same MDP as the parent:\n%s\n--\n%s'%(out[0], out[1])
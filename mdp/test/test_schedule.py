@@ -1,6 +1,8 @@
 from builtins import range
 from ._tools import *
 
+import time
+
 import mdp.parallel as parallel
 n = numx
 
@@ -49,6 +51,27 @@ def test_cpu_count():
     assert isinstance(n_cpus, int)
 
 
+class _SlowStoreThreadScheduler(parallel.ThreadScheduler):
+    """Thread scheduler which pauses after storing a result."""
+
+    def _store_result(self, result, task_index):
+        super(_SlowStoreThreadScheduler, self)._store_result(result,
+                                                             task_index)
+        time.sleep(0.05)
+
+def test_thread_scheduler_free_after_results():
+    """Test that all threads are free once get_results returned."""
+    scheduler = _SlowStoreThreadScheduler(verbose=False, n_threads=2)
+    for i in range(4):
+        scheduler.add_task(i, parallel.SqrTestCallable())
+    results = scheduler.get_results()
+    assert scheduler._n_active_threads == 0
+    # the counter must stay balanced once the threads have finished
+    time.sleep(0.2)
+    assert scheduler._n_active_threads == 0
+    scheduler.shutdown()
+    assert n.all(n.array(results) == n.array([0,1,4,9]))
+
 def test_thread_scheduler_flow():
     """Test thread scheduler with real Nodes."""
     precision = 6
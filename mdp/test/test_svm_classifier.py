@@ -82,6 +82,69 @@ def test_separable_data_is_inside_radius():
                 idx = labs.index(l)
                 assert rad**2 > _sqdist(pos[idx], d)
 
+def test_label_normalizer_multi():
+    from mdp.nodes.svm_classifiers import _LabelNormalizer
+    labels = numx.array([3, -2, 7, 3, 7, 7])
+    normalizer = _LabelNormalizer(labels, "multi")
+    normalized = normalizer.normalize(labels)
+    assert_array_equal(normalized, [1, 0, 2, 1, 2, 2])
+    assert_array_equal(normalizer.revert(normalized), labels)
+
+def test_label_normalizer_dual():
+    from mdp.nodes.svm_classifiers import _LabelNormalizer
+    labels = numx.array([3, 7, 3, 7, 7])
+    normalizer = _LabelNormalizer(labels, "dual")
+    normalized = normalizer.normalize(labels)
+    assert_array_equal(normalized, [1, -1, 1, -1, -1])
+    assert_array_equal(normalizer.revert(normalized), labels)
+
+def test_label_normalizer_dual_too_many_labels():
+    from mdp.nodes.svm_classifiers import _LabelNormalizer
+    pytest.raises(mdp.NodeException, _LabelNormalizer, [1, 2, 3], "dual")
+
+def test_label_normalizer_unknown_label():
+    from mdp.nodes.svm_classifiers import _LabelNormalizer
+    normalizer = _LabelNormalizer([3, -2, 7], "multi")
+    pytest.raises(mdp.NodeException, normalizer.normalize, [4])
+    pytest.raises(mdp.NodeException, normalizer.revert, [3])
+
+def test_label_normalizer_unsortable_labels():
+    from mdp.nodes.svm_classifiers import _LabelNormalizer
+    labels = numx.array([1, "a", 1], dtype=object)
+    pytest.raises(mdp.NodeException, _LabelNormalizer, labels, "multi")
+    normalizer = _LabelNormalizer(numx.array([1, 2], dtype=object), "multi")
+    pytest.raises(mdp.NodeException, normalizer.normalize,
+                  numx.array(["a"], dtype=object))
+
+def test_svm_classifier_cumulation():
+    from mdp.nodes.svm_classifiers import _SVMClassifier
+    node = _SVMClassifier()
+    chunks = [numx_rand.random((n, 3)) for n in (5, 2, 10, 1)]
+    labels = [1, numx.array([2, 3]), [4] * 10, (5.5,)]
+    for x, l in zip(chunks, labels):
+        node.train(x, l)
+    node.stop_training()
+    assert_array_equal(node.data, numx.concatenate(chunks))
+    assert_array_equal(node.labels,
+                       [1] * 5 + [2, 3] + [4] * 10 + [5.5])
+    assert node.labels.dtype == numx.dtype('d')
+    assert node.tlen == 18
+
+def test_group_by_label():
+    from mdp.nodes.svm_classifiers import _group_by_label
+    data = numx_rand.random((7, 3))
+    labels = numx.array([2, -1, 2, 5, -1, 2, 5])
+    groups = _group_by_label(data, labels)
+    assert sorted(groups) == [-1, 2, 5]
+    for label in groups:
+        # a list of the data points, in their original order
+        assert isinstance(groups[label], list)
+        expected = [x for x, l in zip(data, labels) if l == label]
+        assert len(groups[label]) == len(expected)
+        for x, y in zip(groups[label], expected):
+            assert_array_equal(x, y)
+    assert _group_by_label([], []) == {}
+
 @skip_on_condition(
     "not hasattr(mdp.nodes, 'ShogunSVMClassifier')",
     "This test requires the 'shogun' module.")
@@ -105,6 +105,31 @@ def test_symeig_fake_LAPACK_bug():
     val, vec = utils._symeig._symeig_fake(y)
     assert_almost_equal(abs(numx_linalg.det(vec)), 1., 12)
 
+def test_eigh_cov():
+    x = numx_rand.random((100, 5))
+    cov = numx.cov(x, rowvar=False)
+    d, v = utils.eigh_cov(x)
+    assert_array_almost_equal(mult(cov, v), v*d, 10)
+    assert_array_almost_equal(d, numx_linalg.eigvalsh(cov), 10)
+    d2, v2 = utils.eigh_cov(x, k=2)
+    assert v2.shape == (5, 2)
+    assert_array_almost_equal(d2, d[-2:], 10)
+    assert_array_almost_equal(abs(v2), abs(v[:, -2:]), 10)
+    # fewer observations than variables
+    x = numx_rand.random((6, 20))
+    d, v = utils.eigh_cov(x)
+    d2, v2 = utils.eigh_cov(x, k=3)
+    assert v2.shape == (20, 3)
+    assert_array_almost_equal(d2, d[-3:], 10)
+    assert_array_almost_equal(abs(v2), abs(v[:, -3:]), 10)
+
+def test_eigh_cov_invalid_k():
+    # both the tall and the wide case reject k outside of 1..dim
+    for shape in [(100, 5), (5, 8)]:
+        x = numx_rand.random(shape)
+        for k in (0, -1, shape[1] + 1):
+            pytest.raises(utils.SymeigException, utils.eigh_cov, x, k)
+
 def test_QuadraticForm_extrema():
     # TODO: add some real test
     # check H with negligible linear term
@@ -33,7 +33,7 @@
                         SectionHTMLSlideShow, SectionImageHTMLSlideShow,
                         image_slideshow, show_image_slideshow)
 
-from ._symeig import SymeigException
+from ._symeig import SymeigException, eigh_cov
 
 from .symeig_semidefinite import (symeig_semidefinite_reg,
                                   symeig_semidefinite_pca,
@@ -103,7 +103,8 @@ def svd(x, compute_uv=True):
            'DelayCovarianceMatrix', 'CrossCovarianceMatrix',
            'MultipleCovarianceMatrices', 'QuadraticForm',
            'QuadraticFormException',
-           'comb', 'cov2', 'dig_node', 'get_dtypes', 'get_node_size',
+           'comb', 'cov2', 'dig_node', 'eigh_cov', 'get_dtypes',
+           'get_node_size',
            'hermitian', 'inv', 'mult', 'mult_diag', 'nongeneral_svd',
            'norm2', 'permute', 'pinv', 'progressinfo',
            'random_rot', 'refcast', 'rotate', 'scast', 'solve', 'sqrtm',
@@ -3,6 +3,13 @@
 from past.utils import old_div
 import mdp
 from mdp import numx, numx_linalg
+# python 2/3 compatibility
+try:
+    from inspect import signature
+    _arg_names = lambda func: list(signature(func).parameters)
+except ImportError:
+    from inspect import getargspec
+    _arg_names = lambda func: getargspec(func)[0]
 
 class SymeigException(mdp.MDPException):
     pass
@@ -41,6 +48,11 @@ def _assert_eigenvalues_real(w, dtype):
     #    err = "Got negative eigenvalues: %s" % str(w)
     #    raise SymeigException(err)
 
+# True if numx_linalg.eigh takes 'driver' and 'subset_by_index'; scipy >= 1.5
+# deprecates 'turbo' and 'eigvals' in favour of them. This is set together
+# with the choice in pick_symeig, so the signature is inspected only once.
+_eigh_has_driver = None
+
 def wrap_eigh(A, B = None, eigenvectors = True, turbo = "on", range = None,
               type = 1, overwrite = False):
     """Wrapper for scipy.linalg.eigh for scipy version > 0.7"""
@@ -50,10 +62,6 @@ def wrap_eigh(A, B = None, eigenvectors = True, turbo = "on", range = None,
     args['eigvals_only'] = not eigenvectors
     args['overwrite_a'] = overwrite
     args['overwrite_b'] = overwrite
-    if turbo == "on":
-        args['turbo'] = True
-    else:
-        args['turbo'] = False
     args['type'] = type
     if range is not None:
         n = A.shape[0]
@@ -70,12 +78,66 @@ def wrap_eigh(A, B = None, eigenvectors = True, turbo = "on", range = None,
         lo -= 1
         hi -= 1
         range = (lo, hi)
-    args['eigvals'] = range
+    if _eigh_has_driver is None:
+        pick_symeig(numx_linalg)
+    if _eigh_has_driver:
+        args['subset_by_index'] = range
+        if B is None:
+            # LAPACK syevr, which can also compute a subset of the
+            # eigenvalues
+            args['driver'] = 'evr'
+        elif range is None:
+            # divide and conquer, formerly selected by 'turbo', otherwise
+            # the standard algorithm (scipy would default to 'gvd')
+            args['driver'] = 'gvd' if turbo == "on" else 'gv'
+    else:
+        args['turbo'] = turbo == "on"
+        args['eigvals'] = range
     try:
         return numx_linalg.eigh(**args)
     except numx_linalg.LinAlgError as exception:
         raise SymeigException(str(exception))
 
+def eigh_cov(x, k=None):
+    """Return the eigenvalues and eigenvectors of the covariance matrix
+    of 'x'.
+
+    Observations of the same variable are stored on rows, different
+    variables are stored on columns. The covariance matrix is computed
+    with a single matrix product of the centered data and is then
+    decomposed with ``mdp.utils.symeig``. If 'k' is smaller than the
+    number of observations and there are fewer observations than
+    variables, the covariance matrix is not built at all: its leading
+    eigenvectors are the right singular vectors of the centered data.
+
+    :param k: If given, only the 'k' largest eigenvalues and the
+        corresponding eigenvectors are computed. It must lie between 1
+        and the number of variables.
+    :return: A tuple (eigenvalues, eigenvectors) with the eigenvalues
+        in ascending order, as returned by ``symeig``.
+    """
+    n, dim = x.shape
+    if k is not None and not 1 <= k <= dim:
+        err = ("k must be between 1 and the number of variables (%d), "
+               "got %s" % (dim, k))
+        raise SymeigException(err)
+    x = x - x.mean(axis=0)
+    if k is not None and k < n < dim:
+        try:
+            s, v = numx_linalg.svd(x, full_matrices=False)[1:]
+        except numx_linalg.LinAlgError as exception:
+            raise SymeigException(str(exception))
+        # ascending order, like symeig
+        d = (s[k-1::-1]**2) / (n - 1)
+        return (mdp.utils.refcast(d, x.dtype),
+                mdp.utils.refcast(v[k-1::-1].T, x.dtype))
+    cov = mdp.utils.mult(x.T, x) / (n - 1)
+    # remove asymmetries due to rounding errors
+    cov = (cov + cov.T) / 2.
+    if k is None:
+        return mdp.utils.symeig(cov, overwrite=True)
+    return mdp.utils.symeig(cov, range=(dim - k + 1, dim), overwrite=True)
+
 def _symeig_fake(A, B = None, eigenvectors = True, turbo = "on", range = None,
                  type = 1, overwrite = False):
     """Solve standard and generalized eigenvalue problem for symmetric
@@ -175,3 +237,32 @@ def _symeig_fake(A, B = None, eigenvectors = True, turbo = "on", range = None,
     else:
         return mdp.utils.refcast(w, dtype)
 
+
+
+# eigh function -> (symeig implementation, description)
+_symeig_choice = {}
+
+def pick_symeig(numx_linalg):
+    """Return the symeig implementation to use with 'numx_linalg'.
+
+    If ``numx_linalg.eigh`` supports the rich interface of scipy > 0.7,
+    it is wrapped directly, otherwise (numpy or an old scipy) our own
+    rich wrapper is used. The choice only depends on the eigh function,
+    so the introspection is done once per process.
+
+    :return: A tuple (symeig, description).
+    """
+    global _eigh_has_driver
+    eigh = numx_linalg.eigh
+    try:
+        return _symeig_choice[eigh]
+    except KeyError:
+        pass
+    names = _arg_names(eigh)
+    _eigh_has_driver = 'subset_by_index' in names
+    if len(names) > 4:
+        choice = (wrap_eigh, 'scipy.linalg.eigh')
+    else:
+        choice = (_symeig_fake, 'symeig_fake')
+    _symeig_choice[eigh] = choice
+    return choice
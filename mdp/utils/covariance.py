@@ -93,7 +93,10 @@ def update(self, x):
         # update the covariance matrix, the average and the number of
         # observations (try to do everything inplace)
         self._cov_mtx += mdp.utils.mult(x.T, x)
-        self._avg += x.sum(axis=0)
+        # the column sums go through BLAS as well, which is several times
+        # faster than x.sum(axis=0) on row-major data
+        ones = numx.ones(x.shape[0], dtype=self._dtype)
+        self._avg += mdp.utils.mult(ones, x)
         self._tlen += x.shape[0]
 
     def fix(self, center=True):